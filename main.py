@@ -1,18 +1,49 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
-from datetime import date, datetime, timedelta
-import requests
+from datetime import date, datetime, timedelta, timezone
+from cachetools import TTLCache
+from functools import lru_cache
+from random import randrange
+from types import MappingProxyType
+import asyncio
+import calendar
+import httpx
+import msgspec
+import numpy as np
+import orjson
 import os
+import time
+
+# uvloop заметно быстрее дефолтного селекторного цикла; на Vercel приложение
+# импортируется без uvicorn-флагов, поэтому ставим политику цикла прямо здесь
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # Windows или uvloop не установлен
+    pass
 
 # ---------- Инициализация приложения ----------
 app = FastAPI(
     title="AstroAgent MVP API",
     version="1.0.0",
-    description="Ежедневный персональный прогноз: западная астрология (Aztro) + простые правила ведической/нумерологии, RU/EN."
+    description="Ежедневный персональный прогноз: западная астрология (Aztro) + простые правила ведической/нумерологии, RU/EN.",
+    default_response_class=ORJSONResponse,
+)
+
+# Общий HTTP-клиент: keep-alive + HTTP/2, чтобы не открывать соединение на каждый запрос
+_http = httpx.AsyncClient(
+    timeout=8.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
 )
 
+@app.on_event("shutdown")
+async def _close_http_client():
+    await _http.aclose()
+
 # CORS: разрешаем вызовы с сайта/конструктора
 app.add_middleware(
     CORSMiddleware,
@@ -31,22 +62,25 @@ class PredictRequest(BaseModel):
     language: str = Field("ru", pattern="^(ru|en)$", description="Язык ответа: ru | en")
     sign: Optional[str] = Field(None, description="Знак зодиака (en/ru). Если не передан — определим по дате рождения.")
 
-class LuckyDate(BaseModel):
+# Выходные модели — msgspec.Struct: без валидации и в разы быстрее Pydantic
+# при сериализации; Pydantic остаётся на входе, где валидация нужна
+class LuckyDate(msgspec.Struct, gc=False):
     iso: str
     human: str
     reason: str
 
-class PredictResponse(BaseModel):
+class PredictResponse(msgspec.Struct, gc=False):
     date: str
     user: Dict[str, str]
     zodiac: Dict[str, str]
-    sources: Dict[str, str]
+    sources: msgspec.Raw
     forecast: Dict[str, str]
     lucky_dates: List[LuckyDate]
-    questions: List[str]
+    questions: msgspec.Raw
 
 # ---------- Справочники ----------
-ZODIAC_EN_RU = {
+# Справочники только читаются — замораживаем через MappingProxyType
+ZODIAC_EN_RU = MappingProxyType({
     "aries": "Овен",
     "taurus": "Телец",
     "gemini": "Близнецы",
@@ -59,11 +93,28 @@ ZODIAC_EN_RU = {
     "capricorn": "Козерог",
     "aquarius": "Водолей",
     "pisces": "Рыбы",
-}
-ZODIAC_RU_EN = {v.lower(): k for k, v in ZODIAC_EN_RU.items()}
+})
+ZODIAC_RU_EN = MappingProxyType({v.lower(): k for k, v in ZODIAC_EN_RU.items()})
+
+# Пары «en/ru» по знаку и готовые ответы /zodiac — собираются один раз,
+# обработчики отдают общий read-only dict без аллокаций
+_ZODIAC_PAIRS = {en: {"en": en, "ru": ru} for en, ru in ZODIAC_EN_RU.items()}
+_ZODIAC_RESP = {(en, "ru"): {"sign_en": en, "sign_ru": ru} for en, ru in ZODIAC_EN_RU.items()}
+_ZODIAC_RESP.update({(en, "en"): {"sign_en": en, "sign_ru": en} for en in ZODIAC_EN_RU})
+
+def _build_sign_lookup() -> Dict[str, str]:
+    # Все принимаемые написания знака: en, ru, ru с ё→е, ru без пробелов
+    table: Dict[str, str] = {}
+    for en, ru in ZODIAC_EN_RU.items():
+        low = ru.lower()
+        for variant in (en, low, low.replace("ё", "е"), low.replace(" ", "").replace("ё", "е")):
+            table[variant] = en
+    return table
+
+_SIGN_LOOKUP = MappingProxyType(_build_sign_lookup())
 
 # Благоприятные дни недели (простая эвристика)
-FAVORABLE_WEEKDAYS = {
+FAVORABLE_WEEKDAYS = MappingProxyType({
     "aries": [1],        # Tuesday (0=Mon)
     "taurus": [4],       # Friday
     "gemini": [2],       # Wednesday
@@ -76,139 +127,246 @@ FAVORABLE_WEEKDAYS = {
     "capricorn": [5],    # Saturday
     "aquarius": [5],     # Saturday
     "pisces": [3],       # Thursday
-}
+})
 
-WEEKDAY_NAMES_RU = ["Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье"]
-WEEKDAY_NAMES_EN = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+WEEKDAY_NAMES_RU = ("Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье")
+WEEKDAY_NAMES_EN = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 # Банк советов (минимум, без заглушек)
 ADVICE_BANK = {
     "ru": {
-        "work": [
+        "work": (
             "Сфокусируйтесь на одном приоритетном деле и доведите его до результата.",
             "Завершите начатые задачи — новые начинания перенесите на вторую половину дня.",
             "Согласуйте ожидания с коллегами письменным списком из 3 пунктов."
-        ],
-        "love": [
+        ),
+        "love": (
             "Назовите партнёру одну вещь, за которую вы сегодня благодарны.",
             "Избегайте резких формулировок — уточняйте намерения вопросами.",
             "Планируйте короткую совместную активность (30–40 минут) вечером."
-        ],
-        "energy": [
+        ),
+        "energy": (
             "Сделайте 10‑минутную прогулку без телефона для перезагрузки.",
             "Выпейте чистой воды и сделайте лёгкую разминку спины и шеи.",
             "Отключите уведомления на 45 минут и поработайте в глубоком фокусе."
-        ],
+        ),
     },
     "en": {
-        "work": [
+        "work": (
             "Pick one priority and finish it before lunch.",
             "Close ongoing tasks; start new ones in the afternoon.",
             "Align expectations with a 3‑point written checklist."
-        ],
-        "love": [
+        ),
+        "love": (
             "Tell your partner one thing you’re grateful for today.",
             "Avoid sharp wording — clarify intentions with questions.",
             "Plan a short 30–40 min shared activity in the evening."
-        ],
-        "energy": [
+        ),
+        "energy": (
             "Take a 10‑minute phone‑free walk to reset.",
             "Drink water and do a light neck & back stretch.",
             "Mute notifications for 45 minutes of deep focus."
-        ],
+        ),
     }
 }
 
 # ---------- Утилиты ----------
+# Границы знаков (включительно, по западным датам); Козерог разбит по границе года
+_ZODIAC_RANGES = (
+    ("capricorn",  (1, 1),   (1, 19)),
+    ("aquarius",   (1, 20),  (2, 18)),
+    ("pisces",     (2, 19),  (3, 20)),
+    ("aries",      (3, 21),  (4, 19)),
+    ("taurus",     (4, 20),  (5, 20)),
+    ("gemini",     (5, 21),  (6, 20)),
+    ("cancer",     (6, 21),  (7, 22)),
+    ("leo",        (7, 23),  (8, 22)),
+    ("virgo",      (8, 23),  (9, 22)),
+    ("libra",      (9, 23),  (10, 22)),
+    ("scorpio",    (10, 23), (11, 21)),
+    ("sagittarius",(11, 22), (12, 21)),
+    ("capricorn",  (12, 22), (12, 31)),
+)
+
+def _build_zodiac_by_doy() -> tuple:
+    # Опорный невисокосный год: таблица «день года → знак», заполняется один раз
+    table = [None] * 367
+    for sign, (m1, d1), (m2, d2) in _ZODIAC_RANGES:
+        start = date(2001, m1, d1).timetuple().tm_yday
+        end = date(2001, m2, d2).timetuple().tm_yday
+        for doy in range(start, end + 1):
+            table[doy] = sign
+    return tuple(table)
+
+ZODIAC_BY_DOY = _build_zodiac_by_doy()
+
 def zodiac_from_date(d: date) -> str:
-    # Границы включительно по западным датам
-    y = d.year
-    ranges = [
-        ("capricorn",  (date(y, 12, 22), date(y+1, 1, 19))),
-        ("aquarius",   (date(y, 1, 20),  date(y, 2, 18))),
-        ("pisces",     (date(y, 2, 19),  date(y, 3, 20))),
-        ("aries",      (date(y, 3, 21),  date(y, 4, 19))),
-        ("taurus",     (date(y, 4, 20),  date(y, 5, 20))),
-        ("gemini",     (date(y, 5, 21),  date(y, 6, 20))),
-        ("cancer",     (date(y, 6, 21),  date(y, 7, 22))),
-        ("leo",        (date(y, 7, 23),  date(y, 8, 22))),
-        ("virgo",      (date(y, 8, 23),  date(y, 9, 22))),
-        ("libra",      (date(y, 9, 23),  date(y,10, 22))),
-        ("scorpio",    (date(y,10, 23),  date(y,11, 21))),
-        ("sagittarius",(date(y,11, 22),  date(y,12, 21))),
-    ]
-    for sign, (start, end) in ranges:
-        # Козерог пересекает границу года — нормализуем
-        if start.month == 12:
-            if d >= start or d <= end:
-                return sign
-        else:
-            if start <= d <= end:
-                return sign
-    return "capricorn"
+    doy = d.timetuple().tm_yday
+    # В високосном году даты после 29.02 сдвинуты на день относительно опорного;
+    # само 29.02 (doy=60) попадает на ячейку 1 марта — это Рыбы, как и нужно.
+    if doy > 60 and calendar.isleap(d.year):
+        doy -= 1
+    return ZODIAC_BY_DOY[doy]
 
 def normalize_sign(s: Optional[str], d: date) -> str:
     """Принимает en/ru/None, возвращает en-слово."""
     if not s or not s.strip():
         return zodiac_from_date(d)
     s_low = s.strip().lower()
-    if s_low in ZODIAC_EN_RU:
-        return s_low
-    if s_low in ZODIAC_RU_EN:
-        return ZODIAC_RU_EN[s_low]
-    # попытка убрать ё/е и пробелы
-    s_low = s_low.replace("ё", "е").replace(" ", "")
-    if s_low in ZODIAC_RU_EN:
-        return ZODIAC_RU_EN[s_low]
-    raise HTTPException(status_code=400, detail="Unknown zodiac sign")
+    # все написания уже в _SIGN_LOOKUP — на happy path ровно один dict.get
+    sign = _SIGN_LOOKUP.get(s_low) or _SIGN_LOOKUP.get(s_low.replace("ё", "е").replace(" ", ""))
+    if sign is None:
+        raise HTTPException(status_code=400, detail="Unknown zodiac sign")
+    return sign
 
+@lru_cache(maxsize=1024)
 def reduce_digit_sum(n: int) -> int:
+    # Чисто целочисленно, без аллокации строки; входы (день/месяц/год) сильно повторяются
     while n > 9:
-        n = sum(int(c) for c in str(n))
+        s = 0
+        while n:
+            s += n % 10
+            n //= 10
+        n = s
     return n
 
+# День+месяц не превышает 43 — готовая таблица для горячего цикла lucky_dates
+_DIGIT_SUM_0_99 = tuple(reduce_digit_sum(i) for i in range(100))
+
 def life_path_number(bd: date) -> int:
     return reduce_digit_sum(bd.year) + reduce_digit_sum(bd.month) + reduce_digit_sum(bd.day)
 
 def weekday_name(idx: int, lang: str) -> str:
     return WEEKDAY_NAMES_RU[idx] if lang == "ru" else WEEKDAY_NAMES_EN[idx]
 
+# Таблица редуцированных сумм «день + месяц»: [день 0..31, месяц 0..12]
+_DIGIT_SUM_DM_LUT = np.array(
+    [[_DIGIT_SUM_0_99[d + m] for m in range(13)] for d in range(32)], dtype=np.uint8
+)
+
+# Готовые булевы маски «день недели благоприятен» (индекс 0=Пн) —
+# ни set(), ни np.isin на каждый запрос
+_FAV_WD_MASKS = {
+    sign: np.array([wd in wds for wd in range(7)])
+    for sign, wds in FAVORABLE_WEEKDAYS.items()
+}
+_NO_FAV_WD = np.zeros(7, dtype=bool)
+
+@lru_cache(maxsize=256)
+def _lucky_scan(today_ord: int, target: int, sign_en: str, count: int) -> tuple:
+    """Целочисленное ядро скана: (офсет от сегодня, нумерология?) для первых count дней.
+
+    Зависит только от (сегодня, целевая цифра, знак), поэтому результат
+    кэшируется: на каждую комбинацию ядро выполняется один раз в сутки."""
+    fav_mask = _FAV_WD_MASKS.get(sign_en, _NO_FAV_WD)
+    # Сканируем 90 дней вперёд одним батчем вместо питоновского цикла
+    days64 = np.datetime64(date.fromordinal(today_ord)) + np.arange(1, 91)
+    months64 = days64.astype("datetime64[M]")
+    months = months64.astype(np.int64) % 12 + 1
+    doms = (days64 - months64).astype(np.int64) + 1
+    weekdays = (days64.astype(np.int64) + 3) % 7  # эпоха 1970-01-01 — четверг
+    # правило 1: сумма (день+месяц) редуцирована = life_path
+    num_hits = _DIGIT_SUM_DM_LUT[doms, months] == target
+    # правило 2: благопр. день недели для знака
+    wd_hits = fav_mask[weekdays]
+    return tuple(
+        (int(i) + 1, bool(num_hits[i]))
+        for i in np.flatnonzero(num_hits | wd_hits)[:count]
+    )
+
 def lucky_dates(bd: date, sign_en: str, lang: str, count: int = 3) -> List[LuckyDate]:
     lp = reduce_digit_sum(bd.year) + reduce_digit_sum(bd.month) + reduce_digit_sum(bd.day)
-    fav_wd = set(FAVORABLE_WEEKDAYS.get(sign_en, []))
+    target = reduce_digit_sum(lp)
     today = date.today()
+    names = WEEKDAY_NAMES_RU if lang == "ru" else WEEKDAY_NAMES_EN
     found: List[LuckyDate] = []
-    i = 1
-    while len(found) < count and i <= 90:
-        day = today + timedelta(days=i)
-        # правило 1: сумма (день+месяц) редуцирована = life_path
-        ds = reduce_digit_sum(day.day + day.month)
-        reason = None
-        if ds == reduce_digit_sum(lp):
+    # date-объекты строим только для первых count совпадений; формат даты —
+    # f-string вместо strftime (strftime ходит в локаль на каждый вызов)
+    for offset, is_num in _lucky_scan(today.toordinal(), target, sign_en, count):
+        day = today + timedelta(days=offset)
+        if is_num:
             reason = "Нумерология совпала" if lang == "ru" else "Numerology match"
-        # правило 2: благопр. день недели для знака
-        if reason is None and day.weekday() in fav_wd:
+        else:
             reason = "Благоприятный день недели" if lang == "ru" else "Favorable weekday"
-        if reason:
-            human = f"{day.strftime('%d.%m.%Y')} ({weekday_name(day.weekday(), lang)})"
-            found.append(LuckyDate(iso=day.isoformat(), human=human, reason=reason))
-        i += 1
+        human = f"{day.day:02d}.{day.month:02d}.{day.year:04d} ({names[day.weekday()]})"
+        found.append(LuckyDate(iso=day.isoformat(), human=human, reason=reason))
     return found
 
 def pick_advice(lang: str) -> Dict[str, str]:
-    import random
     bank = ADVICE_BANK[lang]
     return {
-        "work":   random.choice(bank["work"]),
-        "love":   random.choice(bank["love"]),
-        "energy": random.choice(bank["energy"]),
+        "work":   bank["work"][randrange(3)],
+        "love":   bank["love"][randrange(3)],
+        "energy": bank["energy"][randrange(3)],
     }
 
-def get_western_horoscope_aztro(sign_en: str) -> Optional[Dict[str, str]]:
+# Кэш Aztro: гороскоп одинаков для всех с одним знаком в пределах UTC-суток,
+# так что наружу ходим максимум 12 раз в день. Неудачи помним коротко (60 с),
+# чтобы не добивать upstream во время сбоя. _aztro_inflight защищает от
+# «stampede»: параллельные запросы одного знака ждут один общий fetch.
+_aztro_cache: TTLCache = TTLCache(maxsize=32, ttl=3600)
+_aztro_failed: TTLCache = TTLCache(maxsize=32, ttl=60)
+_aztro_inflight: Dict[str, "asyncio.Task"] = {}
+
+async def get_western_horoscope_aztro(sign_en: str) -> Optional[Dict[str, str]]:
+    key = f"{sign_en}:{datetime.now(timezone.utc).date().isoformat()}"
+    if key in _aztro_cache:
+        return _aztro_cache[key]
+    if key in _aztro_failed:
+        return None
+    # Single-flight: первый запрос запускает fetch отдельной задачей, остальные
+    # ждут её же; shield не даёт отмене одного клиента уронить общий fetch
+    task = _aztro_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_store(key, sign_en))
+        _aztro_inflight[key] = task
+    return await asyncio.shield(task)
+
+async def _fetch_and_store(key: str, sign_en: str) -> Optional[Dict[str, str]]:
+    try:
+        result = await _fetch_aztro(sign_en)
+        if result is not None:
+            _aztro_cache[key] = result
+        else:
+            _aztro_failed[key] = None
+        return result
+    finally:
+        _aztro_inflight.pop(key, None)
+
+# Ретраи + circuit breaker вокруг Aztro: короткие сбои пережидаем с
+# экспоненциальной паузой, а после 5 неудач подряд на минуту вообще не ходим
+# наружу — /predict сразу отдаёт локальный fallback вместо ожидания таймаутов.
+_AZTRO_RETRY_PAUSES = (0.1, 0.4, None)  # None = последняя попытка, без паузы
+_AZTRO_ATTEMPT_TIMEOUT = 0.6  # сек на попытку — чтобы ретраи успевали в бюджет
+_AZTRO_TOTAL_BUDGET = 2.0     # сек на все попытки: /predict не выходит за SLA
+_aztro_breaker = {"fails": 0, "open_until": 0.0}
+
+async def _fetch_aztro(sign_en: str) -> Optional[Dict[str, str]]:
+    if time.monotonic() < _aztro_breaker["open_until"]:
+        return None
+    try:
+        async with asyncio.timeout(_AZTRO_TOTAL_BUDGET):
+            for pause in _AZTRO_RETRY_PAUSES:
+                result = await _fetch_aztro_once(sign_en)
+                if result is not None:
+                    _aztro_breaker["fails"] = 0
+                    return result
+                if pause is not None:
+                    await asyncio.sleep(pause)
+    except TimeoutError:
+        pass
+    _aztro_breaker["fails"] += 1
+    if _aztro_breaker["fails"] >= 5:
+        _aztro_breaker["fails"] = 0
+        _aztro_breaker["open_until"] = time.monotonic() + 60.0
+    return None
+
+async def _fetch_aztro_once(sign_en: str) -> Optional[Dict[str, str]]:
     """Aztro: POST https://aztro.sameerkumar.website/?sign=aries&day=today"""
     url = "https://aztro.sameerkumar.website/"
     try:
-        r = requests.post(url, params={"sign": sign_en, "day": "today"}, timeout=8)
+        r = await _http.post(url, params={"sign": sign_en, "day": "today"},
+                             timeout=_AZTRO_ATTEMPT_TIMEOUT)
         if r.status_code == 200:
             data = r.json()
             return {
@@ -220,7 +378,8 @@ def get_western_horoscope_aztro(sign_en: str) -> Optional[Dict[str, str]]:
                 "lucky_time": data.get("lucky_time", ""),
             }
         return None
-    except requests.RequestException:
+    # ValueError: r.json() на невалидном теле кидает stdlib JSONDecodeError
+    except (httpx.HTTPError, ValueError):
         return None
 
 def local_summary(lang: str, sign_en: str) -> str:
@@ -228,25 +387,54 @@ def local_summary(lang: str, sign_en: str) -> str:
         return "День подходит для аккуратного продвижения в делах и спокойного общения."
     return "A steady day for focused progress and calm communication."
 
+# Статика /predict: вопросы и источники не зависят от запроса —
+# сериализуем один раз и подставляем готовые JSON-фрагменты
+_QUESTIONS_RU = [
+    "Какую одну цель вы хотите продвинуть сегодня?",
+    "Что поможет улучшить отношения/коммуникацию на этой неделе?",
+    "Когда вам удобнее начать новый проект в ближайшие 7 дней?"
+]
+_QUESTIONS_EN = [
+    "What’s the one goal you want to move today?",
+    "What would improve your relationships/communication this week?",
+    "When is the best moment to start a new project within 7 days?"
+]
+_QUESTIONS_RAW = {
+    "ru": msgspec.Raw(msgspec.json.encode(_QUESTIONS_RU)),
+    "en": msgspec.Raw(msgspec.json.encode(_QUESTIONS_EN)),
+}
+_SOURCES_RAW = msgspec.Raw(msgspec.json.encode({
+    "western": "Aztro (public API, daily); fallback: local",
+    "vedic": "Simple favorable weekday heuristic",
+    "numerology": "Digit-sum life path & date match"
+}))
+
 # ---------- Эндпоинты ----------
+# /health дёргают probe'ы с частотой до нескольких раз в секунду —
+# пересобираем JSON-байты не чаще раза в секунду
+_health_cache: tuple = (0.0, b"")
+
 @app.get("/health")
 def health():
-    return {"ok": True, "timestamp": datetime.utcnow().isoformat() + "Z"}
+    global _health_cache
+    now = time.monotonic()
+    if now - _health_cache[0] > 1.0:
+        ts = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+        body = orjson.dumps({"ok": True, "timestamp": ts})
+        _health_cache = (now, body)
+    return Response(content=_health_cache[1], media_type="application/json")
 
 @app.get("/zodiac")
 def zodiac(birth_date: date = Query(..., description="YYYY-MM-DD"), lang: str = Query("ru", pattern="^(ru|en)$")):
-    sign_en = zodiac_from_date(birth_date)
-    sign_ru = ZODIAC_EN_RU[sign_en]
-    return {"sign_en": sign_en, "sign_ru": sign_ru if lang == "ru" else sign_en}
+    return _ZODIAC_RESP[(zodiac_from_date(birth_date), lang)]
 
-@app.post("/predict", response_model=PredictResponse)
-def predict(req: PredictRequest):
+@app.post("/predict")
+async def predict(req: PredictRequest):
     # 1) Знак
     sign_en = normalize_sign(req.sign, req.birth_date)
-    sign_ru = ZODIAC_EN_RU[sign_en]
 
     # 2) Источник западной астрологии (Aztro) с fallback
-    west = get_western_horoscope_aztro(sign_en)
+    west = await get_western_horoscope_aztro(sign_en)
     summary = west["summary"] if (west and west.get("summary")) else local_summary(req.language, sign_en)
 
     # 3) Советы (работа/любовь/энергия)
@@ -255,28 +443,13 @@ def predict(req: PredictRequest):
     # 4) Благоприятные даты
     lucky = lucky_dates(req.birth_date, sign_en, req.language, count=3)
 
-    # 5) Вопросы пользователю (под задачи MVP)
-    questions_ru = [
-        "Какую одну цель вы хотите продвинуть сегодня?",
-        "Что поможет улучшить отношения/коммуникацию на этой неделе?",
-        "Когда вам удобнее начать новый проект в ближайшие 7 дней?"
-    ]
-    questions_en = [
-        "What’s the one goal you want to move today?",
-        "What would improve your relationships/communication this week?",
-        "When is the best moment to start a new project within 7 days?"
-    ]
-    qs = questions_ru if req.language == "ru" else questions_en
-
-    return PredictResponse(
+    # 5) Сериализация через msgspec: структуры кодируются в JSON-байты напрямую,
+    # инвариантные куски (вопросы, источники) подставляются уже готовыми
+    resp = PredictResponse(
         date=date.today().isoformat(),
         user={"name": req.name, "language": req.language},
-        zodiac={"en": sign_en, "ru": sign_ru},
-        sources={
-            "western": "Aztro (public API, daily); fallback: local",
-            "vedic": "Simple favorable weekday heuristic",
-            "numerology": "Digit-sum life path & date match"
-        },
+        zodiac=_ZODIAC_PAIRS[sign_en],
+        sources=_SOURCES_RAW,
         forecast={
             "summary": summary,
             "work": adv["work"],
@@ -284,5 +457,6 @@ def predict(req: PredictRequest):
             "energy": adv["energy"],
         },
         lucky_dates=lucky,
-        questions=qs
+        questions=_QUESTIONS_RAW[req.language],
     )
+    return Response(content=msgspec.json.encode(resp), media_type="application/json")